@@ -1,273 +1,483 @@
+import logging
+import os
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
 import pandas as pd
 import geopandas as gpd
 import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Column types for the breach report; repeated strings are stored as categoricals
+DTYPES = {
+    'Name of Covered Entity': 'category',
+    'State': 'category',
+    'Type of Breach': 'category',
+    'Location of Breached Information': 'category',
+    'Individuals Affected': 'Int64',
+}
+DATE_FORMAT = '%Y-%m-%d'
+
+# PyArrow parses the CSV on multiple threads; fall back to the C parser when it isn't installed
+CSV_ENGINE = 'pyarrow' if pa is not None else 'c'
+
+# Smallest frame worth handing to the multi-threaded Arrow CSV writer; below this to_csv is just as fast
+ARROW_CSV_MIN_ROWS = 100_000
+
+# CSVs larger than this are summarized chunk by chunk with aggregate() instead of loaded whole
+STREAMING_MIN_BYTES = 512 * 1024 * 1024
+
+# Bump when the parsing or the derived 'Year'/'Month' columns change so cached Parquet copies are rebuilt
+PARQUET_SCHEMA_VERSION = 1
+PARQUET_SCHEMA_KEY = b'breach_report_schema'
+
+
+# Two-letter codes in the breach report mapped to the state names used in the GeoJSON
+STATE_ABBREVIATION_TO_NAME = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "FL": "Florida", "GA": "Georgia",
+    "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
+    "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+    "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota", "MS": "Mississippi", "MO": "Missouri",
+    "MT": "Montana", "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire", "NJ": "New Jersey",
+    "NM": "New Mexico", "NY": "New York", "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
+    "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina",
+    "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont",
+    "VA": "Virginia", "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+    "DC": "District of Columbia"
+}
+
+
+def _year_and_month(dates):
+    """
+    Derive the year and month of each date directly from the datetime64 buffer.
+
+    :param dates: Series or array of datetime64 values without NaT; NaT would come out as a garbage integer.
+    :return: Tuple of int64 arrays (year, months since 1970-01).
+    """
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    return dates.astype('datetime64[Y]').astype('int64') + 1970, dates.astype('datetime64[M]').astype('int64')
+
+
+def _read_csv(file_path):
+    """
+    Parse the breach report CSV and derive the 'Year' and 'Month' columns.
+
+    :param file_path: Path to the CSV file.
+    :return: DataFrame with the parsed breach data.
+    """
+    data = pd.read_csv(file_path, dtype=DTYPES, engine=CSV_ENGINE)
+
+    # Convert the dates after the read rather than through parse_dates: the PyArrow engine infers
+    # them as date objects and turns a blank date into the string 'None' when asked to parse them
+    data['Breach Submission Date'] = pd.to_datetime(data['Breach Submission Date'], format=DATE_FORMAT)
+
+    # Derive the year and month once so the summaries don't have to
+    # Rows without a date get a missing Year and Month, so groupbys drop them as they did with .dt.year
+    years, months = _year_and_month(data['Breach Submission Date'])
+    undated = data['Breach Submission Date'].isna().to_numpy()
+    data['Year'] = pd.arrays.IntegerArray(years, undated)
+    data['Month'] = pd.arrays.IntegerArray(months, undated)
+
+    return data
+
+
+def _parquet_schema():
+    """
+    Describe how the cached Parquet data was produced, so a change to DTYPES, DATE_FORMAT or
+    PARQUET_SCHEMA_VERSION makes existing copies stale.
+
+    :return: Bytes stored in the Parquet file metadata.
+    """
+    return f"{PARQUET_SCHEMA_VERSION}:{sorted(DTYPES.items())}:{DATE_FORMAT}".encode()
+
+
+def _parquet_is_current(parquet_path, csv_path):
+    """
+    Check whether the Parquet copy is newer than the CSV and was written with the current schema.
+
+    :param parquet_path: Path to the Parquet file.
+    :param csv_path: Path to the CSV file.
+    :return: True if the Parquet copy can be used as is.
+    """
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+        return False
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return metadata.get(PARQUET_SCHEMA_KEY) == _parquet_schema()
+
+
+def ensure_parquet(csv_path):
+    """
+    Write the parsed breach data to a Parquet file next to the CSV, unless an up-to-date one already exists.
+
+    The file is written to a temporary name and moved into place, so a concurrent reader never sees
+    a partial file.
+
+    :param csv_path: Path to the CSV file.
+    :return: Path to the Parquet file.
+    :raises OSError: If the Parquet file can't be written, e.g. in a read-only directory.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if _parquet_is_current(parquet_path, csv_path):
+        return parquet_path
+
+    table = pa.Table.from_pandas(_read_csv(csv_path), preserve_index=False)
+    table = table.replace_schema_metadata({**table.schema.metadata, PARQUET_SCHEMA_KEY: _parquet_schema()})
+
+    fd, temp_path = tempfile.mkstemp(suffix='.parquet', dir=os.path.dirname(parquet_path) or '.')
+    os.close(fd)
+    try:
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, parquet_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return parquet_path
+
+
+@lru_cache(maxsize=4)
+def _load(file_path, mtime):
+    """
+    Load the breach data, from the Parquet copy when PyArrow is available. Cached on (path, mtime)
+    so the file is only re-read when it changes.
+
+    :param file_path: Path to the CSV file.
+    :param mtime: Modification time of the file, used as part of the cache key.
+    :return: DataFrame with the parsed breach data.
+    """
+    if pa is None:
+        return _read_csv(file_path)
+
+    # Parquet keeps the categorical, nullable integer and datetime types, so nothing is re-parsed
+    try:
+        data = pd.read_parquet(ensure_parquet(file_path), engine='pyarrow')
+    except OSError:
+        # The Parquet copy can't be written (e.g. a read-only data directory); just parse the CSV
+        return _read_csv(file_path)
+
+    # A column with no values comes back from Parquet as float64 (e.g. from a CSV with only a header),
+    # so restore any type that didn't survive the round trip
+    lost = {column: dtype for column, dtype in DTYPES.items() if data[column].dtype != dtype}
+    return data.astype(lost) if lost else data
+
+
+def load_breach_data(file_path):
+    """
+    Load the breach report CSV, reusing the parsed DataFrame if the file hasn't changed.
+
+    The returned DataFrame is shared between callers and must be treated as read-only.
+
+    :param file_path: Path to the CSV file.
+    :return: DataFrame with the parsed breach data, including 'Year' and 'Month' columns.
+    """
+    return _load(file_path, os.path.getmtime(file_path))
+
+
+def _percent_increase(values):
+    """
+    Calculate the percent change of each value versus the one before it.
+
+    :param values: Array of values ordered by period.
+    :return: Float array of percent increases; the first entry is NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+
+    # Write straight into one preallocated array; same arithmetic as Series.pct_change
+    percent = np.empty_like(values)
+    percent[:1] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(values[1:], values[:-1], out=percent[1:])
+    percent[1:] -= 1
+    percent[1:] *= 100
+    return percent
+
+
+def _grouped_sum(keys, values):
+    """
+    Sum values per unique key with a single np.bincount pass over the factorized keys.
+
+    :param keys: Series of group keys.
+    :param values: Series of numeric values; missing values are skipped.
+    :return: Tuple of (sorted unique keys, int64 array with the sum for each key).
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    values = values.to_numpy(dtype=np.float64, na_value=0.0)
+
+    # Rows with a missing key get code -1 and are left out, as groupby would
+    present = codes >= 0
+    sums = np.bincount(codes[present], weights=values[present], minlength=len(uniques))
+
+    return uniques, sums.astype(np.int64)
+
+
+def _grouped_median_and_mean(keys, values):
+    """
+    Calculate the median and mean of values per unique key with one sort and a segmented reduce.
+
+    :param keys: Series of group keys.
+    :param values: Series of numeric values; missing values are skipped.
+    :return: Tuple of (sorted unique keys, median array, mean array); keys with no values get NaN.
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    medians = np.full(len(uniques), np.nan)
+    means = np.full(len(uniques), np.nan)
+
+    # Drop missing keys and values, then lay each group out contiguously
+    present = (codes >= 0) & ~np.isnan(values)
+    order = np.argsort(codes[present], kind='stable')
+    codes = codes[present][order]
+    values = values[present][order]
+
+    if codes.size == 0:
+        return uniques, medians, means
+
+    # Each group is a slice starting wherever the code changes; scatter the results back by code
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    counts = np.diff(np.append(starts, codes.size))
+    means[codes[starts]] = np.add.reduceat(values, starts) / counts
+    medians[codes[starts]] = [np.median(group) for group in np.split(values, starts[1:])]
+
+    return uniques, medians, means
+
+
 def save_to_csv(dataframe, output_path):
     """
     Save a DataFrame to a CSV file.
 
+    Frames with at least ARROW_CSV_MIN_ROWS rows are written with the PyArrow CSV writer when it is
+    installed; everything smaller goes through DataFrame.to_csv. The two write the same values but
+    format them differently (Arrow quotes the header and every string cell and writes 10000.0 as
+    10000), so the published report CSVs, which are all far below the threshold, keep the to_csv format.
+
     :param dataframe: The DataFrame to save.
     :param output_path: Path to save the output CSV file.
     :return: None
     """
-    try:
+    if pa is None or len(dataframe) < ARROW_CSV_MIN_ROWS:
         dataframe.to_csv(output_path, index=False)
-        print(f"Data successfully saved to {output_path}")
-    except Exception as e:
-        print(f"An error occurred while saving to CSV: {e}")
+    else:
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
 
-def summarize_covered_entity(file_path):
+        # Arrow writes timestamps with a time of day; write date-only columns as plain dates like to_csv
+        for index, field in enumerate(table.schema):
+            if pa.types.is_timestamp(field.type):
+                try:
+                    table = table.set_column(index, field.name, table.column(index).cast(pa.date32()))
+                except pa.ArrowInvalid:
+                    # Some values have a time of day, so the column is deliberately left as a timestamp
+                    pass
+
+        pacsv.write_csv(table, output_path, pacsv.WriteOptions(quoting_style='needed'))
+    print(f"Data successfully saved to {output_path}")
+
+def summarize_covered_entity(data):
     """
-    Summarize the number of entries for each unique 'Name of Covered Entity' in the CSV file.
+    Summarize the number of entries for each unique 'Name of Covered Entity'.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the count of entries per covered entity.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Group by 'Name of Covered Entity' and count the number of entries for each
-        summary = data['Name of Covered Entity'].value_counts().reset_index()
-        summary.columns = ['Name of Covered Entity', 'Count']
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by 'Name of Covered Entity' and count the number of entries for each, most frequent first
+    summary = data.groupby('Name of Covered Entity', observed=True).size()
+    summary = summary.sort_values(ascending=False, kind='stable').reset_index(name='Count')
+    
+    return summary
     
-def summarize_breaches_by_month(file_path):
+def summarize_breaches_by_month(data):
     """
     Summarize the count of breaches by month.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the count of breaches per month.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Ensure 'Breach Submission Date' is a datetime type
-        data['Breach Submission Date'] = pd.to_datetime(data['Breach Submission Date'])
-        
-        # Extract the month and year from the date
-        data['Month'] = data['Breach Submission Date'].dt.to_period('M')
-        
-        # Group by 'Month' and count the number of entries
-        summary = data['Month'].value_counts().reset_index()
-        summary.columns = ['Month', 'Count']
-        
-        # Sort by month
-        summary = summary.sort_values(by='Month')
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by the integer month and count the number of entries
+    summary = data.groupby('Month', sort=True, observed=True).size().reset_index(name='Count')
+    
+    # Format the month back to YYYY-MM for display
+    summary['Month'] = summary['Month'].to_numpy(dtype=np.int64).astype('datetime64[M]').astype(str)
+    
+    return summary
     
-def summarize_breaches_by_year(file_path):
+def summarize_breaches_by_year(data):
     """
     Summarize the count of breaches by year and calculate the percent increase versus the previous year.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the count of breaches per year and percent increase compared to the previous year.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Ensure 'Breach Submission Date' is a datetime type
-        data['Breach Submission Date'] = pd.to_datetime(data['Breach Submission Date'])
-        
-        # Extract the year from the date
-        data['Year'] = data['Breach Submission Date'].dt.year
-        
-        # Group by 'Year' and count the number of entries
-        summary = data['Year'].value_counts().reset_index()
-        summary.columns = ['Year', 'Count']
-        
-        # Sort by year
-        summary = summary.sort_values(by='Year')
-        
-        # Calculate percent increase compared to the previous year
-        summary['Percent Increase'] = summary['Count'].pct_change() * 100
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by 'Year' and count the number of entries; the result comes back sorted by year
+    summary = data.groupby('Year', sort=True, observed=True).size().reset_index(name='Count')
     
-def summarize_individuals_affected_by_breach_type(file_path):
+    # Calculate percent increase compared to the previous year
+    summary['Percent Increase'] = _percent_increase(summary['Count'].to_numpy())
+    
+    return summary
+    
+def summarize_individuals_affected_by_breach_type(data):
     """
     Summarize the total number of individuals affected grouped by type of breach.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the sum of individuals affected per type of breach.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Ensure 'Individuals Affected' is numeric
-        data['Individuals Affected'] = pd.to_numeric(data['Individuals Affected'], errors='coerce')
-        
-        # Group by 'Type of Breach' and sum the number of individuals affected
-        summary = data.groupby('Type of Breach', as_index=False)['Individuals Affected'].sum()
-        summary = summary.rename(columns={'Individuals Affected': 'Total Individuals Affected'})
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by 'Type of Breach' and sum the number of individuals affected
+    breach_types, totals = _grouped_sum(data['Type of Breach'], data['Individuals Affected'])
+    summary = pd.DataFrame({'Type of Breach': breach_types, 'Total Individuals Affected': totals})
+    
+    return summary
     
-def summarize_individuals_affected_by_year(file_path):
+def summarize_individuals_affected_by_year(data):
     """
     Summarize the total number of individuals affected grouped by year.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the sum of individuals affected per year.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Ensure 'Individuals Affected' is numeric
-        data['Individuals Affected'] = pd.to_numeric(data['Individuals Affected'], errors='coerce')
-        
-        # Ensure 'Breach Submission Date' is a datetime type
-        data['Breach Submission Date'] = pd.to_datetime(data['Breach Submission Date'])
-        
-        # Extract the year from the breach submission date
-        data['Year'] = data['Breach Submission Date'].dt.year
-        
-        # Group by 'Year' and sum the number of individuals affected
-        summary = data.groupby('Year', as_index=False)['Individuals Affected'].sum()
-        summary = summary.rename(columns={'Individuals Affected': 'Total Individuals Affected'})
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by 'Year' and sum the number of individuals affected
+    years, totals = _grouped_sum(data['Year'], data['Individuals Affected'])
+    summary = pd.DataFrame({'Year': years, 'Total Individuals Affected': totals})
+    
+    return summary
     
-def summarize_individuals_affected_by_year_with_percent_increase(file_path):
+def summarize_individuals_affected_by_year_with_percent_increase(data):
     """
     Summarize the total number of individuals affected grouped by year,
     and calculate the percent increase compared to the previous year.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the sum of individuals affected per year and percent increase.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Ensure 'Individuals Affected' is numeric
-        data['Individuals Affected'] = pd.to_numeric(data['Individuals Affected'], errors='coerce')
-        
-        # Ensure 'Breach Submission Date' is a datetime type
-        data['Breach Submission Date'] = pd.to_datetime(data['Breach Submission Date'])
-        
-        # Extract the year from the breach submission date
-        data['Year'] = data['Breach Submission Date'].dt.year
-        
-        # Group by 'Year' and sum the number of individuals affected
-        summary = data.groupby('Year', as_index=False)['Individuals Affected'].sum()
-        summary = summary.rename(columns={'Individuals Affected': 'Total Individuals Affected'})
-        
-        # Calculate percent increase compared to the previous year
-        summary['Percent Increase'] = summary['Total Individuals Affected'].pct_change() * 100
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by 'Year' and sum the number of individuals affected
+    years, totals = _grouped_sum(data['Year'], data['Individuals Affected'])
+    summary = pd.DataFrame({'Year': years, 'Total Individuals Affected': totals})
+    
+    # Calculate percent increase compared to the previous year
+    summary['Percent Increase'] = _percent_increase(totals)
+    
+    return summary
 
     
-def summarize_breaches_by_location(file_path):
+def summarize_breaches_by_location(data):
     """
     Summarize the number of breaches grouped by location of breached information.
 
-    :param file_path: Path to the CSV file.
+    :param data: DataFrame returned by load_breach_data.
     :return: DataFrame with the count of breaches per location.
     """
-    try:
-        # Load the CSV into a DataFrame
-        data = pd.read_csv(file_path)
-        
-        # Group by 'Location of Breached Information' and count the number of breaches
-        summary = data['Location of Breached Information'].value_counts().reset_index()
-        summary.columns = ['Location of Breached Information', 'Count']
-        
-        return summary
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+    # Group by 'Location of Breached Information' and count the number of breaches, most frequent first
+    summary = data.groupby('Location of Breached Information', observed=True).size()
+    summary = summary.sort_values(ascending=False, kind='stable').reset_index(name='Count')
+    
+    return summary
     
 def calculate_median_and_mean_impact(data):
     """
     Calculate the median and mean number of individuals affected per breach type and per year.
     """
-    try:
-        # Group by 'Type of Breach' and calculate median and mean
-        breach_type_stats = data.groupby('Type of Breach')['Individuals Affected'].agg(['median', 'mean']).reset_index()
+    # Group by 'Type of Breach' and calculate median and mean
+    breach_types, medians, means = _grouped_median_and_mean(data['Type of Breach'], data['Individuals Affected'])
+    breach_type_stats = pd.DataFrame({'Type of Breach': breach_types, 'median': medians, 'mean': means})
 
-        # Group by 'Year' and calculate median and mean
-        year_stats = data.groupby('Year')['Individuals Affected'].agg(['median', 'mean']).reset_index()
+    # Group by 'Year' and calculate median and mean
+    years, medians, means = _grouped_median_and_mean(data['Year'], data['Individuals Affected'])
+    year_stats = pd.DataFrame({'Year': years, 'median': medians, 'mean': means})
 
-        return breach_type_stats, year_stats
-    except Exception as e:
-        print(f"Error in calculating median and mean impact: {e}")
-        return None, None
+    return breach_type_stats, year_stats
 
 
-def identify_outliers(data, threshold=1_000_000):
+def identify_outliers(data, threshold=1_000_000, top_k=None):
     """
     Identify breaches with exceptionally high numbers of individuals affected (greater than a given threshold).
+    If top_k is given, return the top_k largest breaches instead, largest first.
     """
-    try:
-        outliers = data[data['Individuals Affected'] > threshold]
-        return outliers
-    except Exception as e:
-        print(f"Error in identifying outliers: {e}")
-        return None
+    affected = data['Individuals Affected'].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    if top_k is not None:
+        # Only rows with a count can be picked, so clamp top_k to how many there are
+        present = np.flatnonzero(~np.isnan(affected))
+        top_k = min(top_k, present.size)
+        if top_k <= 0:
+            return data.iloc[:0]
+        values = affected[present]
+        top = np.argpartition(values, -top_k)[-top_k:]
+        top = top[np.argsort(-values[top], kind='stable')]
+        return data.iloc[present[top]]
+    
+    outliers = data.iloc[np.flatnonzero(affected > threshold)]
+    return outliers
 
 
 def calculate_cumulative_impact(data):
     """
     Calculate the cumulative total of individuals affected over the dataset's timeframe.
+    Returns the total as an int rather than wrapping it in a DataFrame.
     """
-    try:
-        total_affected = data['Individuals Affected'].sum()
-        return pd.DataFrame([{'Cumulative Impact': total_affected}])
-    except Exception as e:
-        print(f"Error in calculating cumulative impact: {e}")
-        return None
+    total_affected = data['Individuals Affected'].sum()
+    return int(total_affected)
 
 
 def analyze_correlation_between_method_and_impact(data):
     """
     Analyze which breach types lead to the highest average number of individuals affected.
     """
-    try:
-        breach_type_impact = data.groupby('Type of Breach')['Individuals Affected'].mean().reset_index()
-        breach_type_impact = breach_type_impact.rename(columns={'Individuals Affected': 'Average Individuals Affected'})
-        return breach_type_impact
-    except Exception as e:
-        print(f"Error in analyzing correlation between method and impact: {e}")
-        return None
+    codes, breach_types = pd.factorize(data['Type of Breach'], sort=True)
+    affected = data['Individuals Affected'].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Sum and count each breach type in one linear pass, skipping missing types and values
+    present = (codes >= 0) & ~np.isnan(affected)
+    sums = np.bincount(codes[present], weights=affected[present], minlength=len(breach_types))
+    counts = np.bincount(codes[present], minlength=len(breach_types))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        averages = sums / counts
+    
+    breach_type_impact = pd.DataFrame({'Type of Breach': breach_types, 'Average Individuals Affected': averages})
+    return breach_type_impact
 
 
 def analyze_method_trends(data):
     """
     Examine how breach methods have evolved over time by counting occurrences per year.
     """
-    try:
-        method_trends = data.groupby(['Year', 'Type of Breach']).size().reset_index(name='Count')
-        return method_trends
-    except Exception as e:
-        print(f"Error in analyzing method trends: {e}")
-        return None
+    type_codes, breach_types = pd.factorize(data['Type of Breach'], sort=True)
+    
+    # Skip rows missing either the breach type or the year, as the groupby did
+    present = (type_codes >= 0) & data['Year'].notna().to_numpy()
+    years = data['Year'].to_numpy(dtype=np.int64, na_value=0)[present]
+    type_codes = type_codes[present]
+    
+    if years.size == 0:
+        return pd.DataFrame({'Year': years, 'Type of Breach': breach_types[:0], 'Count': np.zeros(0, dtype=np.int64)})
+    
+    # Encode each (year, breach type) pair as one integer and count them all in a single bincount
+    first_year = years.min()
+    n_types = len(breach_types)
+    pair_codes = (years - first_year) * n_types + type_codes
+    counts = np.bincount(pair_codes, minlength=(years.max() - first_year + 1) * n_types).reshape(-1, n_types)
+    
+    # Keep only the pairs that occur, in (year, breach type) order
+    year_index, type_index = np.nonzero(counts)
+    method_trends = pd.DataFrame({
+        'Year': year_index + first_year,
+        'Type of Breach': breach_types[type_index],
+        'Count': counts[year_index, type_index],
+    })
+    return method_trends
 
 def filter_data_exclude_year(data, year_to_exclude):
     """
@@ -277,7 +487,8 @@ def filter_data_exclude_year(data, year_to_exclude):
     :param year_to_exclude: Year to exclude from the data
     :return: Filtered DataFrame
     """
-    return data[data['Year'] != year_to_exclude]
+    # Rows without a year are kept, as they were when 'Year' held NaN
+    return data[(data['Year'] != year_to_exclude).fillna(True)]
 
 
 def count_breaches_by_year(data):
@@ -287,13 +498,9 @@ def count_breaches_by_year(data):
     :param data: DataFrame containing the breach data.
     :return: DataFrame with the count of breaches per year.
     """
-    try:
-        # Group by 'Year' and count the number of breaches
-        breaches_per_year = data.groupby('Year').size().reset_index(name='Count of Breaches')
-        return breaches_per_year
-    except Exception as e:
-        print(f"Error in counting breaches by year: {e}")
-        return None
+    # Group by 'Year' and count the number of breaches
+    breaches_per_year = data.groupby('Year', sort=True, observed=True).size().reset_index(name='Count of Breaches')
+    return breaches_per_year
     
 def count_breaches_by_year_with_percent_increase(data):
     """
@@ -302,86 +509,276 @@ def count_breaches_by_year_with_percent_increase(data):
     :param data: DataFrame containing the breach data.
     :return: DataFrame with the count of breaches per year and percent increase.
     """
-    try:
-        # Group by 'Year' and count the number of breaches
-        breaches_per_year = data.groupby('Year').size().reset_index(name='Count of Breaches')
-        
-        # Calculate percent increase compared to the previous year
-        breaches_per_year['Percent Increase'] = breaches_per_year['Count of Breaches'].pct_change() * 100
-        
-        return breaches_per_year
-    except Exception as e:
-        print(f"Error in counting breaches by year with percent increase: {e}")
-        return None
-
-def create_us_heatmap(data_path, geojson_path, output_path="us_heatmap_fixed.png"):
+    # Group by 'Year' and count the number of breaches; the result comes back sorted by year
+    breaches_per_year = data.groupby('Year', sort=True, observed=True).size().reset_index(name='Count of Breaches')
+    
+    # Calculate percent increase compared to the previous year
+    breaches_per_year['Percent Increase'] = _percent_increase(breaches_per_year['Count of Breaches'].to_numpy())
+    
+    return breaches_per_year
+
+@lru_cache(maxsize=1)
+def _load_states(geojson_path):
+    """
+    Read the U.S. state boundaries once and reuse them for every heatmap.
+
+    :param geojson_path: Path to a GeoJSON or GeoParquet (.parquet) file with U.S. state boundaries.
+    :return: GeoDataFrame with one row per state.
+    """
+    if os.fspath(geojson_path).endswith('.parquet'):
+        return gpd.read_parquet(geojson_path)
+    return gpd.read_file(geojson_path)
+
+
+def create_us_heatmap(data_path, geojson_path, output_path="us_heatmap_fixed.png", dpi=300):
     """
     Create a heatmap of incidents on a map of the United States.
 
     :param data_path: Path to the CSV file containing the breach data.
-    :param geojson_path: Path to the GeoJSON file containing U.S. state boundaries.
+    :param geojson_path: Path to the GeoJSON (or GeoParquet) file containing U.S. state boundaries.
     :param output_path: Path to save the generated heatmap image.
+    :param dpi: Resolution of the saved image; lower it (e.g. 150) for faster drafts.
     :return: None
     """
+    # Load breach data
+    data = load_breach_data(data_path)
+    
+    # Convert abbreviations to full state names by renaming the categories, not every row
+    states = data['State'].cat.set_categories(list(STATE_ABBREVIATION_TO_NAME))
+    states = states.cat.rename_categories(STATE_ABBREVIATION_TO_NAME)
+    
+    # Group by state and count incidents
+    state_incidents = states.groupby(states, observed=True).size().rename_axis('State').reset_index(name='Count')
+    
+    # Load GeoJSON for U.S. states
+    us_states = _load_states(geojson_path)
 
-    state_abbreviation_to_name = {
-        "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
-        "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "FL": "Florida", "GA": "Georgia",
-        "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
-        "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
-        "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota", "MS": "Mississippi", "MO": "Missouri",
-        "MT": "Montana", "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire", "NJ": "New Jersey",
-        "NM": "New Mexico", "NY": "New York", "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
-        "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina",
-        "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont",
-        "VA": "Virginia", "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
-        "DC": "District of Columbia"
-    }
+    # Merge geospatial data with breach data
+    merged = us_states.merge(state_incidents, left_on='name', right_on='State', how='left')
+    merged['Count'] = merged['Count'].fillna(0)  # Fill missing states with zero counts
+
+    # Plot the heatmap
+    fig, ax = plt.subplots(1, 1, figsize=(15, 10))
+    merged.plot(column='Count', cmap='YlGnBu', linewidth=0.8, ax=ax, edgecolor='0.8', legend=True)
+    ax.set_title("Heatmap of Incidents by State", fontsize=16)
+    ax.axis('off')
+
+    # Save the heatmap as an image
+    plt.savefig(output_path, dpi=dpi)
+    plt.close()
+    print(f"US Heatmap saved to {output_path}")
+
+
+@contextmanager
+def reporting(name):
+    """
+    Log any error raised while producing part of the report instead of aborting the whole run.
+
+    :param name: Description of the step, used in the log message.
+    """
     try:
-        # Load breach data
-        data = pd.read_csv(data_path)
-        
-        # Convert abbreviations to full state names
-        data['State'] = data['State'].map(state_abbreviation_to_name)
-        
-        # Group by state and count incidents
-        state_incidents = data['State'].value_counts().reset_index()
-        state_incidents.columns = ['State', 'Count']
-        
-        # Load GeoJSON for U.S. states
-        us_states = gpd.read_file(geojson_path)
-
-        # Merge geospatial data with breach data
-        merged = us_states.merge(state_incidents, left_on='name', right_on='State', how='left')
-        merged['Count'] = merged['Count'].fillna(0)  # Fill missing states with zero counts
-
-        # Plot the heatmap
-        fig, ax = plt.subplots(1, 1, figsize=(15, 10))
-        merged.plot(column='Count', cmap='YlGnBu', linewidth=0.8, ax=ax, edgecolor='0.8', legend=True)
-        ax.set_title("Heatmap of Incidents by State", fontsize=16)
-        ax.axis('off')
-
-        # Save the heatmap as an image
-        plt.savefig(output_path, dpi=300)
-        plt.close()
-        print(f"US Heatmap saved to {output_path}")
-
-    except Exception as e:
-        print(f"An error occurred while creating the US heatmap: {e}")
+        yield
+    except Exception:
+        logger.exception("An error occurred while %s", name)
+
+
+def generate_report(data, max_workers=1):
+    """
+    Run every summary over a single loaded DataFrame. The summaries are independent and only
+    read `data`, so they can share a pool of threads; `data` must not be modified while the
+    report is running.
+
+    :param data: DataFrame returned by load_breach_data.
+    :param max_workers: Number of worker threads; defaults to running the summaries one at a time.
+    :return: Dict mapping each report name (the stem of its output CSV) to its DataFrame.
+    """
+    summaries = {
+        'covered_entity_summary': summarize_covered_entity,
+        'breaches_by_month': summarize_breaches_by_month,
+        'breaches_by_location': summarize_breaches_by_location,
+        'breaches_by_year': count_breaches_by_year,
+        'breaches_by_year_with_percent_increase': count_breaches_by_year_with_percent_increase,
+        'individuals_affected_by_breach_type': summarize_individuals_affected_by_breach_type,
+        'individuals_affected_by_year_with_increase': summarize_individuals_affected_by_year_with_percent_increase,
+        'median_and_mean': calculate_median_and_mean_impact,
+        'outliers': identify_outliers,
+        'cumulative_impact': calculate_cumulative_impact,
+        'correlation_between_method_and_impact': analyze_correlation_between_method_and_impact,
+        'method_trends': analyze_method_trends,
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(summary, data) for name, summary in summaries.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    report = {}
+    for name, result in results.items():
+        if name == 'median_and_mean':
+            # One task produces both the per-breach-type and per-year statistics
+            report['median_and_mean_by_breach_type'], report['median_and_mean_by_year'] = result
+        elif name == 'outliers':
+            report[name] = result.drop(columns='Month')
+        elif name == 'cumulative_impact':
+            report[name] = pd.DataFrame([{'Cumulative Impact': result}])
+        else:
+            report[name] = result
+
+    return report
+
+
+def _add_counts(total, base, keys, weights=None):
+    """
+    Bincount keys into a running total that starts at key `base`, growing the total in either
+    direction as needed so keys below the first ones seen (e.g. pre-1970 dates) are handled.
+
+    :param total: Running total array; total[i] holds the count (or weighted sum) for key base + i.
+    :param base: Key stored at total[0], or None before any key has been seen.
+    :param keys: Integer keys to count.
+    :param weights: Optional weights to sum per key instead of counting.
+    :return: Tuple of (updated running total, updated base).
+    """
+    if keys.size == 0:
+        return total, base
+
+    low = keys.min()
+    if base is None:
+        base = low
+    elif low < base:
+        total = np.concatenate((np.zeros(base - low, dtype=total.dtype), total))
+        base = low
+
+    counts = np.bincount(keys - base, weights=weights)
+    if counts.size > total.size:
+        total = np.pad(total, (0, counts.size - total.size))
+    total[:counts.size] += counts
+    return total, base
+
+
+def _counter_to_frame(counter, column):
+    """
+    Turn a Counter into a count summary ordered like the in-memory ones: most frequent first, ties alphabetical.
+
+    :param counter: Counter of key occurrences.
+    :param column: Name of the key column.
+    :return: DataFrame with the key column and 'Count'.
+    """
+    rows = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    return pd.DataFrame(rows, columns=[column, 'Count'])
+
+
+def aggregate(file_path, chunksize=200_000):
+    """
+    Build the count and sum summaries by streaming the CSV in chunks, so memory stays bounded
+    regardless of file size. Summaries that need every row at once (medians, outliers) are not included.
+
+    :param file_path: Path to the CSV file.
+    :param chunksize: Number of rows to read per chunk.
+    :return: Dict mapping each report name (the stem of its output CSV) to its DataFrame.
+    """
+    year_counts = np.zeros(0, dtype=np.int64)
+    year_totals = np.zeros(0, dtype=np.float64)
+    month_counts = np.zeros(0, dtype=np.int64)
+    first_year = first_month = None
+    total_affected = 0
+    breach_type_totals = pd.Series(dtype=np.float64)
+    entity_counts = Counter()
+    location_counts = Counter()
+
+    # Chunked reads need the C parser; categories would differ from chunk to chunk, so keys stay as strings
+    chunks = pd.read_csv(
+        file_path,
+        dtype={column: dtype for column, dtype in DTYPES.items() if dtype != 'category'},
+        parse_dates=['Breach Submission Date'],
+        date_format=DATE_FORMAT,
+        chunksize=chunksize,
+    )
+    for chunk in chunks:
+        # The cumulative impact covers every row, dated or not
+        total_affected += int(chunk['Individuals Affected'].sum())
+
+        # Only rows with a submission date can be bucketed by year and month
+        dated = chunk['Breach Submission Date'].notna().to_numpy()
+        affected = chunk['Individuals Affected'].to_numpy(dtype=np.float64, na_value=0.0)[dated]
+        years, months = _year_and_month(chunk['Breach Submission Date'].to_numpy()[dated])
+
+        # Year counts and totals see the same keys, so they always share the same base
+        year_counts, _ = _add_counts(year_counts, first_year, years)
+        year_totals, first_year = _add_counts(year_totals, first_year, years, weights=affected)
+        month_counts, first_month = _add_counts(month_counts, first_month, months)
+
+        chunk_totals = chunk.groupby('Type of Breach', observed=True)['Individuals Affected'].sum()
+        breach_type_totals = breach_type_totals.add(chunk_totals.astype(np.float64), fill_value=0)
+
+        entity_counts.update(chunk['Name of Covered Entity'].value_counts().to_dict())
+        location_counts.update(chunk['Location of Breached Information'].value_counts().to_dict())
+
+    years = np.flatnonzero(year_counts)
+    months = np.flatnonzero(month_counts)
+    year_offset = first_year if first_year is not None else 0
+    month_offset = first_month if first_month is not None else 0
+    breach_type_totals = breach_type_totals.sort_index()
+
+    breaches_by_year = pd.DataFrame({'Year': years + year_offset, 'Count of Breaches': year_counts[years]})
+    breaches_by_year_with_percent_increase = breaches_by_year.assign(
+        **{'Percent Increase': _percent_increase(year_counts[years])}
+    )
+    individuals_affected_by_year = pd.DataFrame({
+        'Year': years + year_offset,
+        'Total Individuals Affected': year_totals[years].astype(np.int64),
+        'Percent Increase': _percent_increase(year_totals[years]),
+    })
+
+    return {
+        'covered_entity_summary': _counter_to_frame(entity_counts, 'Name of Covered Entity'),
+        'breaches_by_month': pd.DataFrame({
+            'Month': (months + month_offset).astype('datetime64[M]').astype(str),
+            'Count': month_counts[months],
+        }),
+        'breaches_by_location': _counter_to_frame(location_counts, 'Location of Breached Information'),
+        'breaches_by_year': breaches_by_year,
+        'breaches_by_year_with_percent_increase': breaches_by_year_with_percent_increase,
+        'individuals_affected_by_breach_type': pd.DataFrame({
+            'Type of Breach': breach_type_totals.index,
+            'Total Individuals Affected': breach_type_totals.to_numpy().astype(np.int64),
+        }),
+        'individuals_affected_by_year_with_increase': individuals_affected_by_year,
+        'cumulative_impact': pd.DataFrame([{'Cumulative Impact': total_affected}]),
+    }
 
 
 if __name__ == "__main__":
 
     import geopandas as gpd
-    gdf = gpd.read_file("map-assets/ne_110m_admin_1_states_provinces.shp")
-    gdf.to_file("map-assets/output.geojson", driver="GeoJSON")
+    shapefile_path = "map-assets/ne_110m_admin_1_states_provinces.shp"
+    geoparquet_path = "map-assets/output.parquet"
+
+    if pa is not None:
+        # GeoParquet loads much faster than GeoJSON; only convert the shapefile when it has changed
+        if not os.path.exists(geoparquet_path) or os.path.getmtime(geoparquet_path) < os.path.getmtime(shapefile_path):
+            gpd.read_file(shapefile_path).to_parquet(geoparquet_path)
+        geojson_path = geoparquet_path
+    else:
+        gdf = gpd.read_file(shapefile_path)
+        gdf.to_file("map-assets/output.geojson", driver="GeoJSON")
+        geojson_path = "map-assets/output.geojson"
 
 
     # Example usage:
     data_path = "breach_report.csv"  # Replace with your CSV file path
-    geojson_path = "map-assets/output.geojson"  # Replace with your GeoJSON file path
     output_path = "us_heatmap.png"  # Path to save the heatmap
 
-    create_us_heatmap(data_path, geojson_path, output_path)
+    logging.basicConfig()
+
+    with reporting("creating the US heatmap"):
+        create_us_heatmap(data_path, geojson_path, output_path)
+
+    # Write every summary from a single load of the breach data, or stream files too big to load at once
+    with reporting("generating the summary report"):
+        if os.path.getsize(data_path) > STREAMING_MIN_BYTES:
+            report = aggregate(data_path)
+        else:
+            report = generate_report(load_breach_data(data_path))
+        for name, summary in report.items():
+            save_to_csv(summary, f"{name}.csv")
 
 